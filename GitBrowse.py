@@ -1,41 +1,76 @@
 from bs4 import BeautifulSoup
-from colorama import Fore as F, Back as B, Style as S
-from sys import platform
+from colorama import Back as B, Style as S
+from sys import platform, stdout
 
 import os
 import json
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as RawStreamError
+from urllib3.util.retry import Retry
 import threading
 import socket
+import shutil
 import subprocess
 import time
-from pygments import highlight
-from pygments.lexers import guess_lexer_for_filename, TextLexer
-from pygments.util import ClassNotFound
-from pygments.formatters import TerminalFormatter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import quote, unquote
 
 # Importa as mensagens do arquivo messages.py para deixar o codigo mais organizado e limpo. / Import messages from messages.py to keep the code more organized and clean.
 from messages import *
 
 lock = threading.Lock()  # Mutex para sincronização / Mutex for synchronization
+max_workers = 8  # Número máximo de threads por pool / Maximum number of threads per pool
+info_pool = ThreadPoolExecutor(max_workers=max_workers)  # Pool para estrelas e forks / Pool for stars and forks
+files_pool = ThreadPoolExecutor(max_workers=max_workers)  # Pool para listagem de arquivos / Pool for file listing
+clone_pool = ThreadPoolExecutor(max_workers=4)  # Até 4 clones simultâneos / Up to 4 concurrent clones
+session = requests.Session()  # Sessão HTTP compartilhada (keep-alive) / Shared HTTP session (keep-alive)
+session.mount("https://", HTTPAdapter(
+    pool_connections=max_workers,
+    pool_maxsize=max_workers * 2,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False),
+))
 downloaded_file_message = None  # Mensagem de arquivo baixado / Downloaded file message
 internet_connected = True  # Estado inicial da conexão com a Internet / Initial state of Internet connection
+internet_check_interval = 30  # Segundos em que o resultado da verificação é reaproveitado / Seconds the check result is reused
+max_internet_check_interval = 300  # Intervalo máximo com a conexão estável / Maximum interval while the connection is stable
+internet_check_streak = 0  # Verificações seguidas com conexão / Consecutive checks with a connection
+last_internet_check = None  # Momento da última verificação (monotônico) / Time of the last check (monotonic)
+host_cache = {}  # (host, porta) -> (endereços, validade) / (host, port) -> (addresses, expiry)
+host_cache_ttl = 900  # Segundos que um endereço resolvido é reaproveitado / Seconds a resolved address is reused
 config_file = "config.json"  # Nome do arquivo de configuração / Configuration file name
+api_cache_file = os.path.join("cache", "github_api.json")  # Cache de respostas da API / API response cache
+api_cache = {}  # URL -> {'etag', 'data'}, do menos ao mais recente / from least to most recently used
+api_cache_max_entries = 200  # Entradas mantidas ao salvar o cache / Entries kept when saving the cache
+api_cache_max_bytes = 4 * 1024 * 1024  # Tamanho máximo do arquivo de cache / Maximum size of the cache file
 language = "en"  # Idioma padrão / Default language
+lang_messages = messages[language]  # Mensagens do idioma atual / Messages of the current language
+files_wait_timeout = 30  # Segundos de espera pela listagem de arquivos / Seconds to wait for the file listing
+default_branches = {}  # (usuário, repositório) -> branch padrão / (user, repository) -> default branch
+rendered_listings = {}  # (usuário, repositório) -> listagem pronta / (user, repository) -> rendered listing
+lexer_cache = {}  # Extensão -> lexer do Pygments / Extension -> Pygments lexer
+terminal_formatter = None  # Criado na primeira visualização / Built on the first view
+text_lexer = None  # Lexer padrão para tipos desconhecidos / Default lexer for unknown types
+known_dirs = set()  # Diretórios já criados nesta sessão / Directories already created in this session
+# Terminal aceita códigos ANSI para limpar a tela / Terminal accepts ANSI codes to clear the screen
+ansi_clear_supported = stdout.isatty() and (os.name != 'nt' or 'WT_SESSION' in os.environ or 'ANSICON' in os.environ)
 
 def load_config():
     """Carrega a configuração do idioma, solicita seleção se não encontrada. / Loads language configuration, prompts selection if not found."""
-    global language
+    global language, lang_messages
     try:
         with open(config_file, 'r') as file:
             config = json.load(file)
             language = config.get("language")  # Sem valor padrão aqui / No default value here
             if language not in ["en", "pt"]:  # Verifica se o idioma é válido / Check for valid language
                 raise ValueError("Invalid language in config file")
+            lang_messages = messages[language]
     except (FileNotFoundError, json.JSONDecodeError, ValueError):
         print(f"{message_languages['no_language_or_corrupted']}")
-        select_language()
-        save_config()
+        select_language()  # Ja salva a configuração / Already saves the configuration
 
 def save_config():
     """Salva a configuração atual / Save the current configuration."""
@@ -45,7 +80,7 @@ def save_config():
 
 def select_language():
     """Seleciona o idioma / Select the language."""
-    global language
+    global language, lang_messages
     while True:
         clear_screen()
         print(f"{message_languages['select_language']}")
@@ -58,83 +93,209 @@ def select_language():
             break
         else:
             print(f"{message_languages['invalid']}")
+    lang_messages = messages[language]
     save_config()
 
+def load_api_cache():
+    """Carrega o cache de respostas da API do GitHub / Load the GitHub API response cache."""
+    global api_cache
+    try:
+        with open(api_cache_file, 'r') as file:
+            api_cache = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        api_cache = {}
+
+def save_api_cache():
+    """Salva o cache de respostas da API do GitHub / Save the GitHub API response cache."""
+    if not api_cache:
+        return
+    os.makedirs(os.path.dirname(api_cache_file), exist_ok=True)
+    with lock:
+        entries = list(api_cache.items())
+    # Mantém as entradas mais recentes que cabem nos limites / Keep the most recent entries that fit the limits
+    kept, size = [], 0
+    for url, entry in reversed(entries):
+        if len(kept) == api_cache_max_entries:
+            break
+        item = f"{json.dumps(url)}:{json.dumps(entry, separators=(',', ':'))}"  # JSON compacto / Compact JSON
+        if size + len(item) > api_cache_max_bytes:
+            continue  # Grande demais, tenta as próximas / Too large, try the next ones
+        kept.append(item)
+        size += len(item)
+    temp_file = f"{api_cache_file}.tmp"
+    with open(temp_file, 'w') as file:
+        file.write("{" + ",".join(reversed(kept)) + "}")
+    os.replace(temp_file, api_cache_file)  # Troca atômica, sem cache pela metade / Atomic swap, no half-written cache
+
+atexit.register(save_api_cache)
+
+def github_api_get(url, cacheable=None):
+    """Faz um GET na API do GitHub usando ETag para evitar baixar o mesmo conteúdo / GET the GitHub API using ETag to avoid downloading the same content."""
+    with lock:
+        cached = api_cache.pop(url, None)
+        if cached:
+            api_cache[url] = cached  # Move para o fim (mais recente) / Move to the end (most recent)
+    headers = {'If-None-Match': cached['etag']} if cached else {}
+    response = session.get(url, headers=headers)
+    if response.status_code == 304 and cached:
+        return cached['data']  # Não modificado, não consome limite / Not modified, no rate limit spent
+    if response.status_code != 200:
+        return None
+    data = response.json()
+    etag = response.headers.get('ETag')
+    if etag and (cacheable is None or cacheable(data)):
+        with lock:
+            api_cache[url] = {'etag': etag, 'data': data}
+    return data
+
 def get_clear_command():
     """Obtém o comando de limpeza para o sistema operacional / Get the clear command for the operating system."""
-    if platform.lower() in ["linux", "darwin"]:
+    system = platform.lower()
+    if system in ("linux", "darwin"):
         return "clear"
-    elif platform.lower() == "win32":
+    elif system == "win32":
         return "cls"
     return ""
 
+clear_command = get_clear_command()  # O sistema não muda durante a execução / The OS does not change at runtime
+
 def clear_screen():
     """Limpa a tela do console / Clear the console screen."""
-    os.system(get_clear_command())
+    if ansi_clear_supported:
+        print("\x1b[H\x1b[2J\x1b[3J", end="", flush=True)  # Mesma sequência do 'clear', sem abrir processo / Same sequence as 'clear', without spawning a process
+    elif clear_command:
+        os.system(clear_command)
 
 def clear_screen_with_message():
     """Limpa a tela, mas mantém a mensagem de download e o status da conexão no topo. / Clears the screen, but keeps the download message and connection status at the top."""
+    global downloaded_file_message
     clear_screen()
     if not internet_connected:
-        if not downloaded_file_message:
-            print(f"{messages[language]['no_internet']}")
-        else:
-            print(f"{messages[language]['no_internet']}")
-    elif downloaded_file_message:
-        print(downloaded_file_message)
+        print(f"{lang_messages['no_internet']}")
+        return
+    # Lê e limpa juntos, clones em segundo plano também escrevem aqui / Read and reset together, background clones also write here
+    with lock:
+        message, downloaded_file_message = downloaded_file_message, None  # Mostra a mensagem apenas uma vez / Show the message only once
+    if message:
+        print(message)
+
+def resolve_host(host, port):
+    """Resolve o host usando o cache de DNS / Resolve the host using the DNS cache."""
+    now = time.monotonic()
+    cached = host_cache.get((host, port))
+    if cached and now < cached[1]:
+        return cached[0]
+    # Guarda todos os endereços, como o create_connection faria / Keep every address, as create_connection would
+    addresses = list(dict.fromkeys(info[4][:2] for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)))
+    host_cache[(host, port)] = (addresses, now + host_cache_ttl)
+    return addresses
+
+def connect_any(addresses, timeout):
+    """Conecta ao primeiro endereço que responder / Connect to the first address that answers."""
+    error = OSError("no addresses")
+    for address in addresses:
+        try:
+            return socket.create_connection(address, timeout=timeout)
+        except OSError as e:
+            error = e  # Tenta o próximo (ex.: IPv6 inacessível) / Try the next one (e.g. unreachable IPv6)
+    raise error
 
 def check_internet_connection():
     """Verifica a conexão com a Internet / Check the Internet connection."""
-    global internet_connected
+    global internet_connected, last_internet_check, internet_check_streak
+    # Conexão estável dobra o intervalo; sem conexão, verifica com frequência / A stable connection doubles the interval; offline, check often
+    interval = internet_check_interval * 2 ** min(internet_check_streak, 4) if internet_connected else internet_check_interval
+    now = time.monotonic()
+    if last_internet_check is not None and now - last_internet_check < min(interval, max_internet_check_interval):
+        return  # Reaproveita o resultado recente / Reuse the recent result
+    last_internet_check = now
+    was_connected = internet_connected
     try:
-        socket.create_connection(("www.google.com", 80), timeout=2)
+        with connect_any(resolve_host("www.google.com", 80), timeout=2):
+            pass  # Fecha o socket logo após conectar / Close the socket right after connecting
         if not internet_connected:
             internet_connected = True
-            print(f"{messages[language]['internet_established']}")
+            print(f"{lang_messages['internet_established']}")
     except OSError:
         internet_connected = False
+        host_cache.pop(("www.google.com", 80), None)  # Resolve de novo na próxima verificação / Re-resolve on the next check
+    internet_check_streak = internet_check_streak + 1 if internet_connected and was_connected else 0
+
+def ensure_directory(directory):
+    """Cria o diretório apenas na primeira vez que é pedido / Create the directory only the first time it is requested."""
+    with lock:
+        if directory in known_dirs:
+            return
+    os.makedirs(directory, exist_ok=True)
+    with lock:
+        known_dirs.add(directory)
 
 def download_file(file_url, file_name):
     """Baixa um arquivo da URL fornecida e salva com o nome fornecido. / Downloads a file from the given URL and saves it with the given name."""
     global downloaded_file_message
     try:
         directory = os.path.dirname(file_name) or "./downloads"  # Diretório para downloads / Directory for downloads
-        os.makedirs(directory, exist_ok=True)  # Cria o diretório se não existir / Create directory if not exists
+        ensure_directory(directory)  # Cria o diretório se não existir / Create directory if not exists
 
-        with requests.get(file_url, stream=True, allow_redirects=True) as r:  # Solicita o arquivo / Request the file
+        with session.get(file_url, stream=True, allow_redirects=True) as r:  # Solicita o arquivo / Request the file
             r.raise_for_status()  # Verifica se a solicitação foi bem-sucedida / Check if the request was successful
-            with open(file_name, 'wb') as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-        downloaded_file_message = f"{SUCCESS}{file_name}{messages[language]['success']}{RESET}"
-    except requests.exceptions.RequestException as e:
-        print(f"{messages[language]['download_error']} '{file_name}': {e}{RESET}")
+            r.raw.decode_content = True  # Descompacta gzip/deflate se necessário / Decompress gzip/deflate if needed
+            total_size = int(r.headers.get('content-length', 0))
+            if r.headers.get('content-encoding', 'identity') != 'identity':
+                total_size = 0  # Tamanho final desconhecido / Final size unknown
+            try:
+                with open(file_name, 'wb') as f:
+                    if total_size and hasattr(os, 'posix_fallocate'):
+                        try:
+                            os.posix_fallocate(f.fileno(), 0, total_size)  # Reserva o espaço de uma vez / Reserve the space at once
+                        except OSError:
+                            pass  # Sistema de arquivos sem suporte / Filesystem without support
+                    shutil.copyfileobj(r.raw, f, length=1024 * 1024)  # Copia em blocos de 1 MiB / Copy in 1 MiB blocks
+                    f.truncate()  # Descarta espaço reservado não usado / Drop unused reserved space
+            except (requests.exceptions.RequestException, RawStreamError):
+                os.remove(file_name)  # Não deixa arquivo incompleto para a dupla checagem / Don't leave a partial file for the double-check
+                raise
+
+        with lock:
+            downloaded_file_message = f"{SUCCESS}{file_name}{lang_messages['success']}{RESET}"
+    except (requests.exceptions.RequestException, RawStreamError) as e:  # r.raw lança erros do urllib3 / r.raw raises urllib3 errors
+        print(f"{lang_messages['download_error']} '{file_name}': {e}{RESET}")
 
 def get_default_branch(username, repo_name):
     """Obtém o branch padrão de um repositório do GitHub / Get the default branch of a GitHub repository."""
-    url = f"https://api.github.com/repos/{username}/{repo_name}"
-    response = requests.get(url)
-    if response.status_code == 200:
-        repo_data = response.json()
-        return repo_data.get('default_branch', 'main')
+    key = (username, repo_name)
+    with lock:
+        if key in default_branches:
+            return default_branches[key]
+    repo_data = github_api_get(f"https://api.github.com/repos/{username}/{repo_name}")
+    if repo_data is not None:
+        default_branch = repo_data.get('default_branch', 'main')
+        with lock:
+            default_branches[key] = default_branch  # Só guarda respostas válidas / Only store valid answers
+        return default_branch
     else:
         return 'main'
 
 def fetch_repository_files(username, repo, files_dict):
     """Busca os arquivos de um repositório e os armazena no dicionário / Fetch repository files and store them in the dictionary."""
     repo_name, repo_url = repo['name'], repo['url']
-    default_branch = get_default_branch(username, repo_name)
-    files = list_repository_files(repo_url, default_branch)
-    with lock:
-        files_dict[repo_name] = files
+    try:
+        default_branch = get_default_branch(username, repo_name)
+        files = list_repository_files(repo_url, default_branch)
+    except requests.exceptions.RequestException:
+        repo['files_requested'] = False  # Nada guardado, tenta de novo ao abrir outra vez / Nothing stored, retry when opened again
+    else:
+        with lock:
+            files_dict[repo_name] = files
+    finally:
+        repo['files_ready'].set()  # Acorda quem estiver esperando / Wake up whoever is waiting
 
-def fetch_repositories(username, repo_list, files_dict):
-    """Busca os repositórios de um usuário do GitHub e preenche a lista e o dicionário / Fetch GitHub user's repositories and populate the list and dictionary."""
+def fetch_repositories(username, repo_list):
+    """Busca os repositórios de um usuário do GitHub e preenche a lista / Fetch GitHub user's repositories and populate the list."""
     page = 1
     while True:
         url = f"https://github.com/{username}?page={page}&tab=repositories"
-        response = requests.get(url)
+        response = session.get(url)
         if response.status_code == 404:
             return False
         if response.status_code != 200:
@@ -145,20 +306,37 @@ def fetch_repositories(username, repo_list, files_dict):
         if not repos:
             break
 
-        for repo in repos:
-            repo_name = repo.a.text.strip()
-            repo_url = repo.a['href']
-            stars, forks = fetch_repo_additional_info(repo_url)
-            repo_list.append({'name': repo_name, 'url': repo_url, 'stars': stars, 'forks': forks})
-            threading.Thread(target=fetch_repository_files, args=(username, {'name': repo_name, 'url': repo_url}, files_dict)).start()
+        page_repos = [(repo.a.text.strip(), repo.a['href']) for repo in repos]
+        # Busca estrelas e forks da página em paralelo, mantendo a ordem / Fetch the page's stars and forks in parallel, keeping the order
+        infos = info_pool.map(fetch_repo_additional_info, [repo_url for _, repo_url in page_repos])
+        for (repo_name, repo_url), (stars, forks) in zip(page_repos, infos):
+            repo_list.append({'name': repo_name, 'url': repo_url, 'stars': stars, 'forks': forks,
+                              'files_requested': False, 'files_ready': threading.Event()})
         page += 1
     return True
 
+def request_repository_files(username, repo, files_dict):
+    """Inicia a busca dos arquivos na primeira vez que o repositório é aberto / Start fetching the files the first time the repository is opened."""
+    # Só gasta chamadas da API nos repositórios abertos / Only spend API calls on opened repositories
+    if not repo['files_requested']:
+        repo['files_requested'] = True
+        repo['files_ready'].clear()  # Uma busca anterior pode ter falhado / A previous fetch may have failed
+        files_pool.submit(fetch_repository_files, username, repo, files_dict)
+
+def split_github_href(href, branch):
+    """Separa (dono/repositório, branch, caminho) de um link /dono/repo/tree|blob/... / Split (owner/repository, branch, path) from a /owner/repo/tree|blob/... link."""
+    _, owner, repo, _, ref_and_path = href.split('/', 4)
+    if ref_and_path.startswith(f"{branch}/"):
+        path = ref_and_path[len(branch) + 1:]  # Aceita branches com '/' / Accepts branches with '/'
+    else:
+        branch, _, path = ref_and_path.partition('/')  # Branch diferente do esperado / Branch other than expected
+    return f"{owner}/{repo}", branch, unquote(path)
+
 def list_files_recursive(repo_url, indent="", default_branch='main', retry=3):
     """Lista os arquivos de um repositório de forma recursiva / List files in a repository recursively."""
     for _ in range(retry):
         try:
-            response = requests.get(repo_url)
+            response = session.get(repo_url)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             items = soup.find_all('tr', class_='react-directory-row')
@@ -171,36 +349,108 @@ def list_files_recursive(repo_url, indent="", default_branch='main', retry=3):
                 link = item.find('a', class_='Link--primary')
                 if link:
                     name = link.text.strip()
-                    path = link['href']
+                    href = link['href']
+                    location = split_github_href(href, default_branch)  # (dono/repositório, branch, caminho) / (owner/repository, branch, path)
+                    owner_repo, branch, path = location
                     if type_info == "File":
-                        parts = path.split('/')
-                        raw_url = f"https://raw.githubusercontent.com/{parts[1]}/{parts[2]}/{default_branch}/{'/'.join(parts[5:])}"
+                        raw_url = f"https://raw.githubusercontent.com/{owner_repo}/{branch}/{quote(path)}"
                     else:
-                        raw_url = f"https://github.com{path}"
+                        raw_url = f"https://github.com{href}"
 
                     display_name = f"{indent}{name} ({type_info})"
                     if type_info == "Directory":
-                        subdirectory_contents = list_files_recursive(raw_url, indent + "  - ", default_branch, retry)
-                        files_and_dirs.append((display_name, raw_url, "Directory"))
+                        subdirectory_contents = list_files_recursive(raw_url, indent + "  - ", branch, retry)
+                        files_and_dirs.append((display_name, raw_url, "Directory", name, location))
                         files_and_dirs.extend(subdirectory_contents)
                     else:
-                        files_and_dirs.append((display_name, raw_url, "File"))
+                        files_and_dirs.append((display_name, raw_url, "File", name, location))
 
             return files_and_dirs
         except (requests.exceptions.RequestException, requests.exceptions.ConnectionError) as e:
             time.sleep(2)  # Espera antes de tentar novamente / Wait before retrying
     return []
 
+def fetch_repository_tree(owner_repo, default_branch):
+    """Busca a árvore completa do repositório em uma única chamada à API / Fetch the whole repository tree in a single API call."""
+    url = f"https://api.github.com/repos/{owner_repo}/git/trees/{default_branch}?recursive=1"
+    try:
+        # Árvores truncadas são descartadas, então não vão para o cache / Truncated trees are discarded, so they are not cached
+        tree_data = github_api_get(url, cacheable=lambda data: not data.get('truncated'))
+    except requests.exceptions.RequestException:
+        return None
+    if tree_data is None or tree_data.get('truncated'):
+        return None  # Árvore grande demais para uma chamada / Tree too large for a single call
+    return tree_data.get('tree', [])
+
+def build_file_list(owner_repo, default_branch, tree):
+    """Monta a lista de arquivos e diretórios a partir da árvore do Git / Build the files and directories list from the Git tree."""
+    children = {}  # Caminho do pai -> entradas / Parent path -> entries
+    for entry in tree:
+        if entry['type'] not in ('blob', 'tree'):
+            continue  # Ignora submódulos / Skip submodules
+        parent, _, name = entry['path'].rpartition('/')
+        children.setdefault(parent, []).append((name, entry['path'], entry['type']))
+
+    files_and_dirs = []
+
+    def add_entries(parent, indent):
+        # Diretórios primeiro, depois arquivos, como no GitHub / Directories first, then files, like on GitHub
+        for name, path, entry_type in sorted(children.get(parent, []), key=lambda e: (e[2] != 'tree', e[0].lower())):
+            if entry_type == 'tree':
+                files_and_dirs.append((f"{indent}{name} (Directory)", f"https://github.com/{owner_repo}/tree/{default_branch}/{quote(path)}", "Directory", name,
+                                       (owner_repo, default_branch, path)))
+                add_entries(path, indent + "  - ")
+            else:
+                # Caminho codificado como nos links do GitHub ('#', '?', '%') / Path encoded like GitHub's links ('#', '?', '%')
+                files_and_dirs.append((f"{indent}{name} (File)", f"https://raw.githubusercontent.com/{owner_repo}/{default_branch}/{quote(path)}", "File", name,
+                                       (owner_repo, default_branch, path)))
+
+    add_entries("", "")
+    return files_and_dirs
+
 def list_repository_files(repo_url, default_branch='main'):
     """Lista os arquivos de um repositório / List repository files."""
+    owner_repo = repo_url.strip('/')
+    tree = fetch_repository_tree(owner_repo, default_branch)
+    if tree is not None:
+        return build_file_list(owner_repo, default_branch, tree)
+    # Recorre à navegação HTML se a API falhar / Fall back to HTML browsing if the API fails
     full_url = f"https://github.com{repo_url}"
     return list_files_recursive(full_url, default_branch=default_branch)
 
+@lru_cache(maxsize=None)
+def check_command_exists(command):
+    """Verifica se um comando está no PATH, uma vez por comando / Check whether a command is on the PATH, once per command."""
+    return shutil.which(command) is not None
+
+def run_clone(repo_url, repo_name):
+    """Executa o git clone e avisa no topo da tela ao terminar / Run git clone and report at the top of the screen when done."""
+    global downloaded_file_message
+    try:
+        # Descarta a saída e guarda só os erros; sem pedir credenciais, o menu está usando o terminal
+        # Discard the output and keep only the errors; no credential prompts, the menu is using the terminal
+        subprocess.run(["git", "clone", f"https://github.com{repo_url}.git", f"./repositorios/{repo_name}"],
+                       check=True, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                       env={**os.environ, "GIT_TERMINAL_PROMPT": "0"})
+    except subprocess.CalledProcessError as e:
+        with lock:
+            downloaded_file_message = f"{lang_messages['clone_error']} '{repo_name}': {e.stderr.decode(errors='replace').strip()}{RESET}"
+        return
+    with lock:
+        downloaded_file_message = f"{lang_messages['repo_cloned']} '{repo_name}' {lang_messages['success']}."
+
 def clone_repository(repo_url, repo_name):
-    """Clona um repositório / Clone a repository."""
-    subprocess.run(["git", "clone", f"https://github.com{repo_url}.git", f"./repositorios/{repo_name}"])
-    print(f"{messages[language]['repo_cloned']} '{repo_name}' {messages[language]['success']}.")
+    """Clona um repositório em segundo plano / Clone a repository in the background."""
+    global downloaded_file_message
+    if not check_command_exists("git"):
+        with lock:
+            downloaded_file_message = lang_messages['git_not_found']
+        return
+    with lock:
+        downloaded_file_message = f"{lang_messages['cloning']}'{repo_name}'{HEADER}...{RESET}"
+    clone_pool.submit(run_clone, repo_url, repo_name)
 
+@lru_cache(maxsize=64)
 def print_centered_header(text, total_width=30):
     """Imprime um cabeçalho centralizado / Print a centered header."""
     text_length = len(text)
@@ -212,14 +462,27 @@ def print_centered_header(text, total_width=30):
 
 def highlight_code(file_path):
     """Destaca o código de um arquivo / Highlight code from a file."""
+    global terminal_formatter, text_lexer
+    # Pygments só é carregado quando um arquivo é visualizado / Pygments is only loaded when a file is viewed
+    from pygments import highlight
+    from pygments.lexers import guess_lexer_for_filename, TextLexer
+    from pygments.util import ClassNotFound
+    from pygments.formatters import TerminalFormatter
+    if terminal_formatter is None:
+        terminal_formatter = TerminalFormatter()
+        text_lexer = TextLexer()
     with open(file_path, 'r') as file:
         code = file.read()
-    try:
-        lexer = guess_lexer_for_filename(file_path, code)
-    except ClassNotFound:
-        lexer = TextLexer()  # Use TextLexer as a default fallback
-    formatter = TerminalFormatter()
-    highlighted_code = highlight(code, lexer, formatter)
+    # Reaproveita o lexer já descoberto para a mesma extensão / Reuse the lexer already found for the same extension
+    lexer_key = os.path.splitext(file_path)[1].lower() or os.path.basename(file_path)
+    lexer = lexer_cache.get(lexer_key)
+    if lexer is None:
+        try:
+            lexer = guess_lexer_for_filename(file_path, code)
+        except ClassNotFound:
+            lexer = text_lexer  # Use TextLexer as a default fallback
+        lexer_cache[lexer_key] = lexer
+    highlighted_code = highlight(code, lexer, terminal_formatter)
     os.remove(file_path)  # Remove o arquivo temporário / Remove the temporary file
     clear_screen()
     print(f"\n{highlighted_code}\n")
@@ -238,7 +501,7 @@ def get_forks_count(soup):
 def fetch_repo_additional_info(repo_url):
     """Busca a contagem de estrelas e forks de um repositório / Fetch stars and forks count for a repository."""
     url = f"https://github.com{repo_url}"
-    response = requests.get(url)
+    response = session.get(url)
     if response.status_code == 200:
         soup = BeautifulSoup(response.text, 'html.parser')
         stars = int(soup.find('a', {'href': f'{repo_url}/stargazers'}).text.strip().split()[0].replace(',', ''))
@@ -250,10 +513,10 @@ def fetch_repo_additional_info(repo_url):
 def handle_file_action(file_name, file_url, file_type):
     """Trata a ação do arquivo (visualizar ou baixar) com base na escolha do usuário. / Handles file action (view or download) based on user choice."""
     downloads_dir = os.path.join(os.getcwd(), "downloads")
-    os.makedirs(downloads_dir, exist_ok=True)  # Cria o diretório de downloads se não existir / Create the downloads directory if it doesn't exist
+    ensure_directory(downloads_dir)  # Cria o diretório de downloads se não existir / Create the downloads directory if it doesn't exist
     while True:
         clear_screen_with_message()
-        action = input(f"{messages[language]['view_or_download']}")
+        action = input(f"{lang_messages['view_or_download']}")
         if action == 'd':
             download_path = os.path.join(downloads_dir, file_name)
             download_file(file_url, download_path)
@@ -261,117 +524,115 @@ def handle_file_action(file_name, file_url, file_type):
         elif action == 'v' and file_type == "File":
             download_file(file_url, file_name)  # Baixa o arquivo antes de visualizar / Download the file before viewing
             highlight_code(file_name)
-            download_after_view = input(f"{messages[language]['download_prompt']}")
+            download_after_view = input(f"{lang_messages['download_prompt']}")
             if download_after_view.lower() in ('s', 'y'):
                 download_file(file_url, os.path.join(downloads_dir, file_name))
             break
         elif action == 'b':
             break
         else:
-            print(f"{messages[language]['invalid_option']}")
-        downloaded_file_message = None  # Reseta a mensagem após o loop / Reset the message after the loop
-
-def handle_directory_download(dir_url, dir_name, default_branch, ask_confirmation=True):
-    """Baixa um diretório de forma recursiva e faz a dupla checagem / Downloads a directory recursively and performs a double-check."""
-    if ask_confirmation:
-        confirmation = input(f"{messages[language]['download_prompt']}")
-        if confirmation.lower() not in ('s', 'y'):
-            return
+            print(f"{lang_messages['invalid_option']}")
+
+def list_directory_files(dir_url, location):
+    """Lista (caminho relativo, URL raw) de todos os arquivos de um diretório / List (relative path, raw URL) of every file in a directory."""
+    owner_repo, branch, dir_path = location  # Guardado na listagem, sem reinterpretar a URL / Stored in the listing, without reparsing the URL
+    raw_prefix = f"https://raw.githubusercontent.com/{owner_repo}/{branch}/{quote(dir_path)}/"
+    tree = fetch_repository_tree(owner_repo, branch)
+    if tree is not None:
+        # Filtra a árvore numa única passada, sem montar a listagem / Filter the tree in a single pass, without building the listing
+        path_prefix = f"{dir_path}/"
+        prefix_len = len(path_prefix)
+        return [(entry['path'][prefix_len:], f"{raw_prefix}{quote(entry['path'][prefix_len:])}") for entry in tree
+                if entry['type'] == 'blob' and entry['path'].startswith(path_prefix)]
+    entries = list_files_recursive(dir_url, default_branch=branch)  # Recorre ao HTML / Fall back to HTML
+    prefix_len = len(raw_prefix)
+    return [(unquote(raw_url[prefix_len:]), raw_url) for _, raw_url, file_type, _, _ in entries
+            if file_type == "File" and raw_url.startswith(raw_prefix)]
+
+def handle_directory_download(dir_url, dir_name, location):
+    """Baixa um diretório com downloads em paralelo e faz a dupla checagem / Downloads a directory with parallel downloads and performs a double-check."""
+    global downloaded_file_message
+    confirmation = input(f"{lang_messages['download_prompt']}")
+    if confirmation.lower() not in ('s', 'y'):
+        return
 
     dir_path = os.path.join("diretorios", dir_name)
-    os.makedirs(dir_path, exist_ok=True)
+    ensure_directory(dir_path)
+
+    downloads = [(raw_url, os.path.join(dir_path, *relative_path.split('/')))
+                 for relative_path, raw_url in list_directory_files(dir_url, location)]
+    if not downloads:
+        # Listagem falhou ou veio vazia / Listing failed or came back empty
+        downloaded_file_message = f"{lang_messages['download_error']} '{dir_name}'.{RESET}"
+        return
+
+    # Baixa todos os arquivos em paralelo / Download all files in parallel
+    with ThreadPoolExecutor(max_workers=max_workers * 2) as pool:
+        list(pool.map(lambda download: download_file(*download), downloads))
+
+    # Double-check to ensure all files are downloaded
+    for raw_url, file_path in downloads:
+        if not os.path.exists(file_path):
+            download_file(raw_url, file_path)
 
-    try:
-        response = requests.get(dir_url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        items = soup.find_all('tr', class_='react-directory-row')
-        
-        downloaded_files = []
-
-        for item in items:
-            icon = item.find('svg')
-            type_info = "Directory" if "icon-directory" in icon.get('class', []) else "File"
-            link = item.find('a', class_='Link--primary')
-            if link:
-                name = link.text.strip()
-                path = link['href']
-                if type_info == "File":
-                    parts = path.split('/')
-                    raw_url = f"https://raw.githubusercontent.com/{parts[1]}/{parts[2]}/{default_branch}/{'/'.join(parts[5:])}"
-                    download_file(raw_url, os.path.join(dir_path, name))
-                    downloaded_files.append((name, raw_url, "File"))
-                elif type_info == "Directory":
-                    new_dir_name = os.path.join(dir_name, name)
-                    handle_directory_download(f"https://github.com{path}", new_dir_name, default_branch, ask_confirmation=False)
-                    downloaded_files.append((name, f"https://github.com{path}", "Directory"))
-
-        # Double-check to ensure all files are downloaded
-        for name, raw_url, file_type in downloaded_files:
-            if file_type == "File":
-                if not os.path.exists(os.path.join(dir_path, name)):
-                    download_file(raw_url, os.path.join(dir_path, name))
-            elif file_type == "Directory":
-                handle_directory_download(raw_url, os.path.join(dir_name, name), default_branch, ask_confirmation=False)
-
-    except requests.exceptions.RequestException as e:
-        print(f"{messages[language]['download_error']} '{dir_name}': {e}{RESET}")
-        
 def display_repository_files(username, repo_name, files):
     """Exibe os arquivos do repositório com um menu interativo. / Displays repository files with an interactive menu."""
     clear_screen()
     check_internet_connection()  # Verifica a conexão com a Internet / Check the Internet connection
-    print(f"\n{WHITE}{print_centered_header(f'[{username}/{repo_name}]', 50)}{RESET}\n")
-    for i, (display_name, file_url, file_type) in enumerate(files):
-        print(f"{i + 1}. {display_name}")
+    # Monta a listagem uma vez por repositório e escreve de uma vez / Build the listing once per repository and write it at once
+    listing = rendered_listings.get((username, repo_name))
+    if listing is None:
+        lines = [f"\n{WHITE}{print_centered_header(f'[{username}/{repo_name}]', 50)}{RESET}\n"]
+        lines.extend(f"{i + 1}. {display_name}" for i, (display_name, _, _, _, _) in enumerate(files))
+        listing = rendered_listings[(username, repo_name)] = "\n".join(lines)
+    print(listing)
 
     while True:  # Loop para tratar da seleção de arquivos / Loop to handle file selection
-        file_option = input(f"{messages[language]['choose_file']}")
+        file_option = input(f"{lang_messages['choose_file']}")
         if file_option.isdigit():
             file_index = int(file_option) - 1
             if 0 <= file_index < len(files):
-                _, file_url, file_type = files[file_index]
-                file_name = files[file_index][0].split(' (')[0]  # Extrai o nome do arquivo / Extract the file name
+                _, file_url, file_type, file_name, location = files[file_index]  # Nome já calculado na listagem / Name already computed when listing
                 if file_type == "Directory":
-                    default_branch = get_default_branch(username, repo_name)
-                    handle_directory_download(file_url, file_name, default_branch)
+                    handle_directory_download(file_url, file_name, location)
                 else:
                     handle_file_action(file_name, file_url, file_type)
                 break  # Sai do loop após a ação do arquivo / Exit the loop after file action
             else:
-                print(f"{messages[language]['invalid_file_number']}")
+                print(f"{lang_messages['invalid_file_number']}")
         elif file_option.lower() == 'b':
             return  # Volta ao menu anterior / Return to the previous menu
         else:
-            print(f"{messages[language]['invalid_option']}")
+            print(f"{lang_messages['invalid_option']}")
 
 def main():
     """Função principal que executa o programa / Main function that runs the program."""
-    clear = lambda: os.system(get_clear_command())
-    clear()
+    clear_screen()
 
-    load_config()
+    load_config()  # Garante um idioma válido / Ensures a valid language
+    load_api_cache()
 
-    if language not in ["pt", "en"]:
-        select_language()
+    # Verifica a conexão enquanto o usuário digita / Check the connection while the user types
+    connection_probe = threading.Thread(target=check_internet_connection, daemon=True)
+    connection_probe.start()
 
-    print(f"{messages[language]['welcome']}")
+    print(f"{lang_messages['welcome']}")
     username = input(f"{PREFIX_IN}{WHITE}")
 
-    check_internet_connection()  # Verifica a conexão com a Internet / Check the Internet connection
+    connection_probe.join()
     if not internet_connected:
         clear_screen_with_message()
 
-    print(f"{messages[language]['searching_user']}{username}{HEADER}...{RESET}")
+    print(f"{lang_messages['searching_user']}{username}{HEADER}...{RESET}")
 
     repositories = []
     files_dict = {}
-    if not fetch_repositories(username, repositories, files_dict):  # Busca os repositórios / Fetch the repositories
-        print(f"{messages[language]['user_not_found']}")
+    if not fetch_repositories(username, repositories):  # Busca os repositórios / Fetch the repositories
+        print(f"{lang_messages['user_not_found']}")
         return
 
     clear_screen()
-    print(f"{messages[language]['user_prefix']}{username}{messages[language]['user_found']}")
+    print(f"{lang_messages['user_prefix']}{username}{lang_messages['user_found']}")
 
     current_page = 0
     repos_per_page = 10
@@ -382,35 +643,44 @@ def main():
         clear_screen_with_message()
         start = current_page * repos_per_page
         end = min(start + repos_per_page, len(repositories))
-        print(f"\n{WHITE}{print_centered_header(f'[{username}]', header_width)}{RESET}\n")
-        for i in range(start, end):
-            repo = repositories[i]
-            print(f"{i + 1}. {HEADER}{repo['name']:<60}{F.LIGHTYELLOW_EX}Stars: {WHITE}{repo['stars']} | {F.LIGHTGREEN_EX}Forks: {WHITE}{repo['forks']}{RESET}")
-        print(f"\n{WHITE}{print_centered_header(f'[Page {current_page + 1}/{total_pages}]', header_width)}{RESET}\n")
-        print(f"{messages[language]['page_details']}")
-        repo_option = input(f"{messages[language]['choose_option']}")
+        # Monta a página inteira e escreve de uma vez / Build the whole page and write it at once
+        lines = [
+            f"\n{WHITE}{print_centered_header(f'[{username}]', header_width)}{RESET}\n",
+            *(f"{i + 1}. {HEADER}{repo['name']:<60}{STARS_LABEL}{repo['stars']}{FORKS_LABEL}{repo['forks']}{RESET}"
+              for i, repo in enumerate(islice(repositories, start, end), start)),
+            f"\n{WHITE}{print_centered_header(f'[Page {current_page + 1}/{total_pages}]', header_width)}{RESET}\n",
+            lang_messages['page_details'],
+        ]
+        print("\n".join(lines))
+        repo_option = input(f"{lang_messages['choose_option']}")
 
         if repo_option.isdigit():
             repo_index = int(repo_option) - 1 + start
             repo_name = repositories[repo_index]['name']
             clear_screen_with_message()
             
-            print(f"{messages[language]['options_for']} {repo_name}{messages[language]['view_or_clone']}")
-            action = input(f"{messages[language]['choose_option']}")
+            print(f"{lang_messages['options_for']} {repo_name}{lang_messages['view_or_clone']}")
+            action = input(f"{lang_messages['choose_option']}")
             if action == '1':
+                request_repository_files(username, repositories[repo_index], files_dict)
                 clear_screen_with_message()
+                # Espera a listagem terminar em vez de pedir nova tentativa / Wait for the listing instead of asking for a retry
+                files_ready = repositories[repo_index]['files_ready']
+                if not files_ready.is_set():
+                    print(f"{lang_messages['processing']}")  # Avisa enquanto espera / Tell the user while waiting
+                files_ready.wait(files_wait_timeout)
                 if repo_name in files_dict:
                     files = files_dict[repo_name]
                     display_repository_files(username, repo_name, files)
                 else:
-                    print(f"{messages[language]['processing']}")
+                    print(f"{lang_messages['processing']}")
             elif action == '2':
                 clear_screen_with_message()
                 if internet_connected:
                     repo_url = repositories[repo_index]['url']
                     clone_repository(repo_url, repo_name)
                 else:
-                    print(f"{messages[language]['cannot_clone_no_internet']}")
+                    print(f"{lang_messages['cannot_clone_no_internet']}")
         elif repo_option.lower() == 'p' and current_page < total_pages - 1:
             current_page += 1
         elif repo_option.lower() == 'n' and current_page > 0:
@@ -418,13 +688,7 @@ def main():
         elif repo_option.lower() == 'b':
             break
         else:
-            print(f"{messages[language]['invalid_option']}")
-
-        downloaded_file_message = None  # Reseta a mensagem após o loop / Reset the message after the loop
-
-def clear_screen():
-    """Limpa a tela do console / Clear the console screen."""
-    os.system(get_clear_command())
+            print(f"{lang_messages['invalid_option']}")
 
 if __name__ == "__main__":
     main()
@@ -10,6 +10,8 @@ INFO = F.CYAN
 WHITE = F.WHITE
 HEADER = F.LIGHTMAGENTA_EX
 FOOTER = F.MAGENTA
+STARS_LABEL = F.LIGHTYELLOW_EX + "Stars: " + WHITE
+FORKS_LABEL = " | " + F.LIGHTGREEN_EX + "Forks: " + WHITE
 
 message_languages = {
     "no_language_or_corrupted": f"{ERROR}Language not selected or file corrupted.\nLinguagem nao selecionada ou arquivo corrompido.{RESET}",
@@ -23,7 +25,10 @@ messages = {
         "no_internet": f"{ERROR}Conexao com internet nao estabelecida. Voce pode visualizar repositorios, mas nao visualizar nem baixar arquivos.{RESET}",
         "internet_established": f"{SUCCESS}Conexao estabelecida.{RESET}",
         "download_error": f"{ERROR}Erro ao baixar",
+        "clone_error": f"{ERROR}Erro ao clonar",
+        "git_not_found": f"{ERROR}Git não encontrado. Instale o Git para clonar repositórios.{RESET}",
         "repo_cloned": f"\n{PREFIX_OUT} Repositório {WHITE}",
+        "cloning": f"\n{PREFIX_OUT} Clonando o repositório {WHITE}",
         "success": f"{HEADER} baixado com sucesso.{RESET}",
         "invalid_option": f"{ERROR}Opção inválida!{RESET}",
         "choose_file": f"{PREFIX_OUT}\nEscolha um arquivo (número) ou 'b' para voltar: {WHITE} {RESET}",
@@ -48,7 +53,10 @@ messages = {
         "no_internet": f"{ERROR}No internet connection established. You can view repositories, but not view or download files.{RESET}",
         "internet_established": f"{SUCCESS}Connection established.{RESET}",
         "download_error": f"{ERROR}Error downloading",
+        "clone_error": f"{ERROR}Error cloning",
+        "git_not_found": f"{ERROR}Git not found. Install Git to clone repositories.{RESET}",
         "repo_cloned": f"\n{PREFIX_OUT} Repository {WHITE}",
+        "cloning": f"\n{PREFIX_OUT} Cloning repository {WHITE}",
         "success": f"{HEADER} downloaded succesfully.{RESET}",
         "invalid_option": f"{ERROR}Invalid option!{RESET}",
         "choose_file": f"{PREFIX_OUT}\nChoose a file (number) or 'b' to go back: {WHITE} {RESET}",